@@ -0,0 +1,96 @@
+"""Tests for the Google Sheets sync against an in-memory sheet"""
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vinted_price_bot as vpb
+
+
+class FakeSpreadsheet:
+    """Records the batch requests a sync sends"""
+
+    def __init__(self):
+        self.batch_updates = []
+        self.values_batch_updates = []
+
+    def batch_update(self, body):
+        self.batch_updates.append(body)
+
+    def values_batch_update(self, params=None, body=None):
+        self.values_batch_updates.append(body)
+
+
+class FakeSheet:
+    """Worksheet stand-in holding raw (unformatted) values"""
+
+    id = 0
+    title = 'Sheet1'
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.spreadsheet = FakeSpreadsheet()
+
+    def get_values(self, value_render_option=None):
+        return self.rows
+
+
+class SyncWithGoogleSheetsTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.digest_file = os.path.join(tmp.name, 'digest')
+        patcher = mock.patch.object(vpb, 'SYNC_DIGEST_FILE', self.digest_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.sheet = FakeSheet([
+            vpb.SHEET_HEADER,
+            ['1', 'https://www.vinted.lv/items/1-a', 'A', 10.0, 9.8, '', -2, 'Active', '2026-01-01 10:00:00'],
+        ])
+        with mock.patch.dict(os.environ, {'DEFAULT_PRICE_CHANGE_PERCENT': '-2'}):
+            self.bot = vpb.VintedPriceBot()
+        self.bot.sheet = self.sheet
+
+    def items(self):
+        return [{'id': '1', 'title': 'A', 'price': 10.0, 'url': 'https://www.vinted.lv/items/1-a'}]
+
+    def test_unchanged_sync_still_queues_price_write_back(self):
+        self.bot.sync_with_google_sheets(self.items())
+        self.bot.sheet_rows = {}
+
+        # Nothing changed since the first sync, so the digest check skips the write phase
+        writes_before = len(self.sheet.spreadsheet.batch_updates)
+        to_update = self.bot.sync_with_google_sheets(self.items())
+        self.assertEqual(len(self.sheet.spreadsheet.batch_updates), writes_before)
+        self.assertEqual([item['id'] for item in to_update], ['1'])
+
+        self.bot.record_price_update(to_update[0])
+        self.assertEqual(self.bot.pending_sheet_writes, [
+            {'range': "'Sheet1'!D2:E2", 'values': [[9.8, 9.8]]},
+        ])
+
+    def test_sync_that_writes_does_not_enable_the_skip(self):
+        items = self.items() + [{'id': '2', 'title': 'B', 'price': 5.0, 'url': 'https://www.vinted.lv/items/2-b'}]
+        self.bot.sync_with_google_sheets(items)
+        self.assertEqual(len(self.sheet.spreadsheet.batch_updates), 1)
+
+        # The fake sheet keeps its rows, as if the user deleted the appended one
+        self.bot.sync_with_google_sheets(items)
+        self.assertEqual(len(self.sheet.spreadsheet.batch_updates), 2)
+
+    def test_failed_sheet_read_aborts_before_writing(self):
+        error = vpb.gspread.exceptions.GSpreadException('read failed')
+        with mock.patch.object(self.sheet, 'get_values', side_effect=error):
+            with self.assertRaises(vpb.gspread.exceptions.GSpreadException):
+                self.bot.sync_with_google_sheets(self.items())
+        self.assertEqual(self.sheet.spreadsheet.batch_updates, [])
+        self.assertFalse(os.path.exists(self.digest_file))
+
+
+if __name__ == '__main__':
+    unittest.main()
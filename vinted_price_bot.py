@@ -4,36 +4,261 @@ Automatically updates Vinted item prices based on Google Sheets configuration
 """
 
 import os
+import re
+import json
 import time
+import shutil
+import subprocess
+import hashlib
 import logging
+import logging.handlers
+import threading
 from datetime import datetime
+from itertools import groupby
+from queue import Queue, Empty
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
+import requests
+from requests.adapters import HTTPAdapter
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 
 import gspread
+from gspread.utils import rowcol_to_a1
 from google.oauth2.service_account import Credentials
+from google.auth.transport.requests import AuthorizedSession
 
 # Configure logging
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+# The buffered file handler formats records itself - MemoryHandler only passes them on
+file_handler = logging.FileHandler('vinted_bot.log')
+file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler('vinted_bot.log'),
+        # Buffer file writes - flushed every 1024 records, on errors and at exit
+        logging.handlers.MemoryHandler(capacity=1024, target=file_handler),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Canonical sheet layout written by the bot (columns A-I)
+SHEET_HEADER = ['Item ID', 'URL', 'Title', 'Current Price', 'New Price', 'Floor Price', 'Price Change %', 'Status', 'Last Updated']
+COLUMN_INDEX = {name: idx for idx, name in enumerate(SHEET_HEADER)}
+
+# Fingerprint of the last completed sheet sync (see sync_with_google_sheets)
+SYNC_DIGEST_FILE = '.vinted_sync_digest'
+
+# Resolved ChromeDriver binary, reused across runs while the installed Chrome version is unchanged
+DRIVER_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'vinted-bot', 'chromedriver.json')
+
+# Session cookies saved after a successful login so later runs can skip the login form
+SESSION_COOKIES_FILE = '.vinted_session.json'
+SESSION_MAX_AGE = 7 * 24 * 3600  # Seconds - older sessions go through the full login again
+
+# Collects [data-testid, href, title, price text] for every item card on the profile page.
+# The price lives in the card container two levels above the overlay link.
+LISTING_SCROLL_JS = """
+const [maxSeconds, stableTicksNeeded] = arguments;
+return new Promise(resolve => {
+    const cards = new Map();
+    const collect = () => {
+        for (const link of document.querySelectorAll("[data-testid*='--overlay-link']")) {
+            const testid = link.getAttribute('data-testid');
+            const id = testid && testid.includes('product-item-id-') ? testid.replace('product-item-id-', '').split('--')[0] : null;
+            const container = link.parentElement && link.parentElement.parentElement;
+            const price = id && container ? container.querySelector(`[data-testid='product-item-id-${id}--price-text']`) : null;
+            const card = [testid, link.href, link.getAttribute('title'), price ? price.textContent : null];
+            const known = cards.get(link.href);
+            // Keep the first sighting, unless it was caught before its price rendered
+            if (!known || (!known[3] && card[3])) cards.set(link.href, card);
+        }
+    };
+    const deadline = Date.now() + maxSeconds * 1000;
+    let lastCount = -1, stableTicks = 0;
+    const timer = setInterval(() => {
+        collect();
+        stableTicks = cards.size === lastCount ? stableTicks + 1 : 0;
+        lastCount = cards.size;
+        if (stableTicks >= stableTicksNeeded || Date.now() > deadline) {
+            clearInterval(timer);
+            resolve(Array.from(cards.values()));
+        } else {
+            window.scrollTo(0, document.body.scrollHeight);
+        }
+    }, 500);
+});
+"""
+
+# Profile scroll limits - at least the old loop's tolerance (3 empty scrolls 2s apart,
+# at most 20 scrolls), since listings missed here get marked as sold
+SCROLL_IDLE_TICKS = 12  # 500ms ticks without a new card before stopping (6s)
+SCROLL_MAX_SECONDS = 40
+
+# Browser identity used by Chrome and by plain HTTP requests to Vinted
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Price field on the item edit form
+PRICE_INPUT_SELECTOR = "input#price[data-testid='price-input--input']"
+
+# Listings requested per Vinted API page
+API_PAGE_SIZE = 96
+# Hard stop for API paging, in case pagination info is missing or wrong
+API_MAX_PAGES = 50
+
+# Resources the bot never reads - blocked in every browser session via CDP
+BLOCKED_URL_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.webp', '*.avif', '*.gif', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm', '*.m3u8',
+    '*google-analytics*', '*googletagmanager*', '*doubleclick*', '*hotjar*',
+]
+
+# Minimum seconds between price-update error screenshots
+ERROR_SCREENSHOT_INTERVAL = 60
+
+# Sheets API statuses worth retrying (rate limit and transient server errors)
+RETRYABLE_SHEET_STATUSES = {429, 500, 502, 503, 504}
+SHEET_RETRY_ATTEMPTS = 6
+
+# First number in a price label such as "€13.00", "13,00 €" or "1 250,00 €"
+_PRICE_RE = re.compile(r'(\d+[.,]?\d*)')
+# Space/NBSP thousands separators between digits
+_DIGIT_GROUP_RE = re.compile(r'(?<=\d)[\s\u00a0\u202f](?=\d)')
+# Price inside a card's title attribute ("Nike, size: L, 13,00 €") - anchored on the € sign
+_TITLE_PRICE_RE = re.compile(r'(\d+[.,]\d{2})\s*€')
+
+
+def _to_float(value, default=None):
+    """Convert a cell or price text to float, accepting comma decimal separators"""
+    text = str(value).strip().replace(',', '.')
+    if not text:
+        return default  # Empty cells are common - don't pay for an exception
+    try:
+        return float(text)
+    except ValueError:
+        return default
+
+
+def _parse_price(text: str) -> float:
+    """Extract the price from a listing's price label (0.0 if there is no number)"""
+    m = _PRICE_RE.search(_DIGIT_GROUP_RE.sub('', text))
+    return float(m.group(1).replace(',', '.')) if m else 0.0
+
+
+def _chrome_major_version() -> Optional[str]:
+    """Major version of the installed Chrome/Chromium (None if it can't be determined)"""
+    for binary in ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser'):
+        path = shutil.which(binary)
+        if not path:
+            continue
+        try:
+            output = subprocess.check_output([path, '--version'], text=True, timeout=10)
+        except (OSError, subprocess.SubprocessError):
+            continue
+        m = re.search(r'(\d+)\.', output)
+        if m:
+            return m.group(1)
+    return None
+
+
+def _sheets_call(call, *args, **kwargs):
+    """Run a Sheets API call, retrying 429/5xx responses with exponential backoff"""
+    for attempt in range(SHEET_RETRY_ATTEMPTS):
+        try:
+            return call(*args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            status = e.response.status_code
+            if status not in RETRYABLE_SHEET_STATUSES or attempt == SHEET_RETRY_ATTEMPTS - 1:
+                raise
+            delay = min(2 ** attempt, 30)
+            # A rate-limited response says how long to back off
+            retry_after = e.response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+            logger.warning(f"Google Sheets returned HTTP {status}, retrying in {delay}s...")
+            time.sleep(delay)
+
+
+def _chromedriver_major_version(path: str) -> Optional[str]:
+    """Major version of a chromedriver binary (None if it can't be determined)"""
+    try:
+        output = subprocess.check_output([path, '--version'], text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    m = re.search(r'ChromeDriver (\d+)\.', output)
+    return m.group(1) if m else None
+
+
+def _column_index(headers: List[str]) -> Dict[str, int]:
+    """Map column names to positions, skipping the lookups for the canonical layout"""
+    if headers[:len(SHEET_HEADER)] == SHEET_HEADER:
+        return COLUMN_INDEX
+    return {name: headers.index(name) for name in SHEET_HEADER if name in headers}
+
+
+def _parse_sheet_record(record: Dict) -> Dict:
+    """Normalize a sheet row once so the per-item diff needs no conversions"""
+    parsed = dict(record)
+    # Text columns are stripped here so comparisons need no str()/strip() per item
+    for column in ('URL', 'Title', 'Status'):
+        parsed[column] = str(record.get(column, '')).strip()
+    parsed['Current Price'] = _to_float(record.get('Current Price', ''), 0.0)
+    parsed['New Price'] = _to_float(record.get('New Price', ''), 0.0)
+    # Blank percent/floor cells mean "not set" - keep them as None
+    parsed['Price Change %'] = _to_float(record.get('Price Change %', ''))
+    parsed['Floor Price'] = _to_float(record.get('Floor Price', ''))
+    return parsed
+
+
+def _pending_price_updates(items: List[Dict]) -> List[Dict]:
+    """Items whose price actually changes (new discoveries keep their price this run)"""
+    return [item for item in items if item['new_price'] != item['price'] and not item['is_new_discovery']]
+
+
+def _cell_data(value) -> Dict:
+    """CellData for updateCells - numbers stay numbers, anything else is plain text (like RAW input)"""
+    if value is None or value == '':
+        return {}  # No userEnteredValue clears the cell
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return {'userEnteredValue': {'numberValue': value}}
+    return {'userEnteredValue': {'stringValue': str(value)}}
+
+
+def _update_cells_request(sheet_id: int, start_row: int, rows: List[List]) -> Dict:
+    """updateCells request writing rows from column A of the 1-based start_row"""
+    return {
+        'updateCells': {
+            'start': {'sheetId': sheet_id, 'rowIndex': start_row - 1, 'columnIndex': 0},
+            'rows': [{'values': [_cell_data(value) for value in row]} for row in rows],
+            'fields': 'userEnteredValue'
+        }
+    }
+
+
+def _sync_fingerprint(items: List[Dict], existing_dict: Dict) -> str:
+    """Hash scraped items plus sheet rows (ignoring timestamps) to detect no-change runs"""
+    h = hashlib.blake2b(digest_size=16)
+    for item in sorted(items, key=lambda i: i['id']):
+        h.update(f"{item['id']}|{item['price']}|{item['title']}|{item.get('url', '')}\n".encode())
+    h.update(b'--\n')
+    for item_id in sorted(existing_dict):
+        row = existing_dict[item_id]
+        h.update(repr(sorted((k, str(v)) for k, v in row.items() if k != 'Last Updated')).encode())
+        h.update(b'\n')
+    return h.hexdigest()
+
 
 class VintedPriceBot:
     """Bot to manage Vinted item prices via Google Sheets"""
@@ -48,6 +273,18 @@ class VintedPriceBot:
         self.google_sheet_id = os.getenv('GOOGLE_SHEET_ID')
         self.google_creds_path = os.getenv('GOOGLE_SERVICE_ACCOUNT_JSON', './service_account.json')
         self.default_percent = float(os.getenv('DEFAULT_PRICE_CHANGE_PERCENT', '-2'))  # Negative to LOWER prices
+        # Parallel browser sessions for price updates (VINTED_CONCURRENT_TABS is accepted as an alias)
+        update_workers = os.getenv('VINTED_CONCURRENT_TABS') or os.getenv('VINTED_UPDATE_WORKERS', '3')
+        try:
+            self.update_workers = int(update_workers)
+        except ValueError:
+            logger.warning(f"Invalid VINTED_UPDATE_WORKERS value {update_workers!r} - using 3")
+            self.update_workers = 3
+        # Try Vinted's item API before the browser edit form (opt-in - the endpoint is undocumented)
+        self.api_price_updates = os.getenv('VINTED_API_PRICE_UPDATES', '').lower() in ('1', 'true', 'yes')
+        # Save page sources and screenshots of failures to /tmp (serializing the DOM is slow, so opt-in)
+        self.debug = os.getenv('VINTED_DEBUG', '').lower() in ('1', 'true', 'yes')
+        self.last_error_screenshot = 0.0
         
         # Extract profile ID from URL (e.g., "https://www.vinted.lv/member/295252411" -> "295252411")
         if self.vinted_profile_url:
@@ -57,90 +294,181 @@ class VintedPriceBot:
         
         self.driver = None
         self.sheet = None
+        # item_id -> sheet row number, as of the last sync
+        self.sheet_rows = {}
+        # Price cells to write back after successful updates, flushed once per run
+        self.pending_sheet_writes = []
+        self.sheet_writes_lock = threading.Lock()
         
     def setup_driver(self):
-        """Initialize Chrome WebDriver with headless options"""
+        """Initialize the main Chrome WebDriver"""
+        self.driver = self.create_driver()
+        
+    def fast_wait(self, timeout: float = 10, driver: webdriver.Chrome = None) -> WebDriverWait:
+        """WebDriverWait polling every 50 ms instead of the default 500 ms"""
+        return WebDriverWait(driver or self.driver, timeout, poll_frequency=0.05)
+        
+    def cdp_wait_for(self, condition_js: str, timeout: float = 10, driver: webdriver.Chrome = None) -> bool:
+        """Wait for a JS condition inside the page - one CDP call instead of a WebDriver poll loop"""
+        expression = (
+            "new Promise(resolve => {"
+            f" const deadline = Date.now() + {int(timeout * 1000)};"
+            f" const check = () => {{ if ({condition_js}) resolve(true);"
+            " else if (Date.now() > deadline) resolve(false);"
+            " else setTimeout(check, 50); };"
+            " check(); })"
+        )
+        result = (driver or self.driver).execute_cdp_cmd('Runtime.evaluate', {
+            'expression': expression,
+            'awaitPromise': True,
+            'returnByValue': True,
+        })
+        return bool(result.get('result', {}).get('value'))
+        
+    def create_driver(self) -> webdriver.Chrome:
+        """Start a new Chrome WebDriver with headless options"""
         logger.info("Setting up Chrome WebDriver...")
         
         chrome_options = Options()
+        # Return from driver.get at DOMContentLoaded - callers wait for the elements they need
+        chrome_options.page_load_strategy = 'eager'
         chrome_options.add_argument('--headless=new')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
+        chrome_options.add_argument('--window-size=1280,800')
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        # Background services a one-shot automation session never uses
+        for flag in ('--disable-extensions', '--disable-background-networking', '--disable-default-apps',
+                     '--disable-sync', '--no-first-run', '--mute-audio', '--disable-renderer-backgrounding',
+                     '--disable-translate', '--disable-features=TranslateUI,BlinkGenPropertyTrees'):
+            chrome_options.add_argument(flag)
+        # Cap per-session memory - matters with several update sessions running side by side
+        chrome_options.add_argument('--renderer-process-limit=1')
+        chrome_options.add_argument('--js-flags=--max-old-space-size=256')
+        chrome_options.add_argument(f'--user-agent={USER_AGENT}')
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
         
         try:
-            # Get ChromeDriver path
-            import os
-            driver_path = ChromeDriverManager().install()
-            logger.info(f"ChromeDriver manager returned: {driver_path}")
-            
-            # Fix for webdriver-manager bug - find the actual chromedriver binary
-            actual_driver = None
-            
-            # Check if it's directly the chromedriver file (exact filename match)
-            filename = os.path.basename(driver_path)
-            if os.path.isfile(driver_path) and (filename == 'chromedriver' or filename == 'chromedriver.exe'):
-                actual_driver = driver_path
-            else:
-                # Navigate up to find the base directory
-                base_dir = driver_path
-                
-                # If the path points to a non-chromedriver file, go to parent directory
-                if os.path.isfile(base_dir):
-                    base_dir = os.path.dirname(base_dir)
-                
-                # Search for chromedriver in this directory and subdirectories
-                logger.info(f"Searching for chromedriver in: {base_dir}")
-                
-                # Common locations
-                possible_paths = [
-                    os.path.join(base_dir, 'chromedriver'),
-                    os.path.join(base_dir, 'chromedriver.exe'),
-                    os.path.join(base_dir, 'chromedriver-linux64', 'chromedriver'),
-                    os.path.join(base_dir, 'chromedriver-win64', 'chromedriver.exe'),
-                    os.path.join(base_dir, 'chromedriver-mac64', 'chromedriver'),
-                ]
-                
-                # Try each possible path
-                for path in possible_paths:
-                    if os.path.isfile(path):
-                        actual_driver = path
-                        logger.info(f"Found chromedriver at: {actual_driver}")
-                        break
-                
-                # If still not found, walk the directory tree
-                if not actual_driver:
-                    for root, dirs, files in os.walk(base_dir):
-                        if 'chromedriver' in files:
-                            actual_driver = os.path.join(root, 'chromedriver')
-                            logger.info(f"Found chromedriver via walk at: {actual_driver}")
-                            break
-                        elif 'chromedriver.exe' in files:
-                            actual_driver = os.path.join(root, 'chromedriver.exe')
-                            logger.info(f"Found chromedriver.exe via walk at: {actual_driver}")
-                            break
-            
-            if not actual_driver or not os.path.isfile(actual_driver):
-                raise Exception(f"Could not find chromedriver binary in {driver_path}")
-            
-            # Make sure it's executable on Linux/Mac
-            if not actual_driver.endswith('.exe'):
-                os.chmod(actual_driver, 0o755)
+            # Resolve the driver binary once per process (or take it from the environment)
+            actual_driver = os.environ.get('CHROMEDRIVER_PATH') or self.find_chromedriver()
+            os.environ['CHROMEDRIVER_PATH'] = actual_driver
             
             logger.info(f"Using ChromeDriver at: {actual_driver}")
             service = Service(actual_driver)
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            
+            # Skip images, fonts and trackers - pages reach DOMContentLoaded much sooner
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
             logger.info("WebDriver setup complete")
+            return driver
             
         except Exception as e:
             logger.error(f"Failed to setup WebDriver: {e}")
             raise
         
+    def find_chromedriver(self) -> str:
+        """Locate ChromeDriver (PATH, run cache, then webdriver-manager) and return the binary path"""
+        chrome_version = _chrome_major_version()
+        
+        # A chromedriver on PATH needs no download - as long as it matches the installed
+        # Chrome (CI images ship one, and installing Chrome can upgrade past it)
+        on_path = shutil.which('chromedriver')
+        if on_path:
+            driver_version = _chromedriver_major_version(on_path)
+            if not chrome_version or driver_version == chrome_version:
+                return on_path
+            logger.info(f"Skipping ChromeDriver {driver_version} on PATH - Chrome is version {chrome_version}")
+        
+        # Reuse the binary found by a previous run while Chrome hasn't been upgraded
+        cached = self.load_driver_cache()
+        if (chrome_version and cached.get('chrome_version') == chrome_version
+                and os.access(cached.get('path', ''), os.X_OK)):
+            logger.info(f"Using cached ChromeDriver for Chrome {chrome_version}")
+            return cached['path']
+        
+        # Checks for driver updates over the network - only needed once per process
+        driver_path = ChromeDriverManager().install()
+        logger.info(f"ChromeDriver manager returned: {driver_path}")
+        
+        # Fix for webdriver-manager bug - find the actual chromedriver binary
+        actual_driver = None
+        
+        # Check if it's directly the chromedriver file (exact filename match)
+        filename = os.path.basename(driver_path)
+        if os.path.isfile(driver_path) and (filename == 'chromedriver' or filename == 'chromedriver.exe'):
+            actual_driver = driver_path
+        else:
+            # Navigate up to find the base directory
+            base_dir = driver_path
+            
+            # If the path points to a non-chromedriver file, go to parent directory
+            if os.path.isfile(base_dir):
+                base_dir = os.path.dirname(base_dir)
+            
+            # Search for chromedriver in this directory and subdirectories
+            logger.info(f"Searching for chromedriver in: {base_dir}")
+            
+            # Common locations
+            possible_paths = [
+                os.path.join(base_dir, 'chromedriver'),
+                os.path.join(base_dir, 'chromedriver.exe'),
+                os.path.join(base_dir, 'chromedriver-linux64', 'chromedriver'),
+                os.path.join(base_dir, 'chromedriver-win64', 'chromedriver.exe'),
+                os.path.join(base_dir, 'chromedriver-mac64', 'chromedriver'),
+            ]
+            
+            # Try each possible path
+            for path in possible_paths:
+                if os.path.isfile(path):
+                    actual_driver = path
+                    logger.info(f"Found chromedriver at: {actual_driver}")
+                    break
+            
+            # If still not found, walk the directory tree
+            if not actual_driver:
+                for root, dirs, files in os.walk(base_dir):
+                    if 'chromedriver' in files:
+                        actual_driver = os.path.join(root, 'chromedriver')
+                        logger.info(f"Found chromedriver via walk at: {actual_driver}")
+                        break
+                    elif 'chromedriver.exe' in files:
+                        actual_driver = os.path.join(root, 'chromedriver.exe')
+                        logger.info(f"Found chromedriver.exe via walk at: {actual_driver}")
+                        break
+        
+        if not actual_driver or not os.path.isfile(actual_driver):
+            raise Exception(f"Could not find chromedriver binary in {driver_path}")
+        
+        # Make sure it's executable on Linux/Mac (skip the chmod if it already is)
+        if not actual_driver.endswith('.exe') and os.stat(actual_driver).st_mode & 0o777 != 0o755:
+            os.chmod(actual_driver, 0o755)
+        
+        if chrome_version:
+            self.save_driver_cache({'chrome_version': chrome_version, 'path': actual_driver})
+        return actual_driver
+        
+    def load_driver_cache(self) -> Dict:
+        """Read the ChromeDriver location saved by a previous run"""
+        try:
+            with open(DRIVER_CACHE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+    def save_driver_cache(self, cache: Dict):
+        """Remember the resolved ChromeDriver location for later runs"""
+        try:
+            os.makedirs(os.path.dirname(DRIVER_CACHE_FILE), exist_ok=True)
+            with open(DRIVER_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            logger.warning(f"Could not save ChromeDriver cache: {e}")
+        
     def setup_google_sheets(self):
         """Initialize Google Sheets connection"""
         logger.info("Setting up Google Sheets connection...")
@@ -151,8 +479,11 @@ class VintedPriceBot:
         ]
         
         creds = Credentials.from_service_account_file(self.google_creds_path, scopes=scope)
-        client = gspread.authorize(creds)
-        self.sheet = client.open_by_key(self.google_sheet_id).sheet1
+        # One keep-alive session with a roomier pool, so sheet calls reuse the TLS connection
+        session = AuthorizedSession(creds)
+        session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        client = gspread.Client(auth=creds, session=session)
+        self.sheet = _sheets_call(client.open_by_key, self.google_sheet_id).sheet1
         
         logger.info("Google Sheets connection established")
         
@@ -160,10 +491,21 @@ class VintedPriceBot:
         """Login to Vinted account"""
         logger.info("Logging into Vinted...")
         
+        # A session saved by a previous run skips the whole login form
+        if self.restore_session():
+            return
+        
         try:
             # Go to the signup/login page (Vinted uses same page for both)
             self.driver.get('https://www.vinted.lv/member/signup/select_type?ref_url=%2F')
-            time.sleep(3)
+            # Wait until the page shows either the cookie banner or the login link
+            try:
+                self.fast_wait(15).until(EC.any_of(
+                    EC.presence_of_element_located((By.ID, "onetrust-accept-btn-handler")),
+                    EC.presence_of_element_located((By.XPATH, "//span[contains(text(), 'Pieteikties')]"))
+                ))
+            except TimeoutException:
+                logger.warning("Login page did not show the cookie banner or login link yet")
             
             logger.info(f"Loaded page: {self.driver.current_url}")
             
@@ -179,12 +521,15 @@ class VintedPriceBot:
                 
                 for by, selector in modal_close_selectors:
                     try:
-                        close_button = WebDriverWait(self.driver, 2).until(
+                        close_button = self.fast_wait(2).until(
                             EC.element_to_be_clickable((by, selector))
                         )
                         close_button.click()
                         logger.info("Closed modal overlay")
-                        time.sleep(1)
+                        try:
+                            self.fast_wait(2).until(EC.invisibility_of_element(close_button))
+                        except TimeoutException:
+                            pass
                         break
                     except:
                         continue
@@ -193,36 +538,35 @@ class VintedPriceBot:
             
             # Accept cookies if present
             try:
-                cookie_button = WebDriverWait(self.driver, 3).until(
+                cookie_button = self.fast_wait(3).until(
                     EC.element_to_be_clickable((By.ID, "onetrust-accept-btn-handler"))
                 )
                 cookie_button.click()
                 logger.info("Accepted cookies")
-                time.sleep(2)
+                # The banner overlays the login link until it is gone
+                self.fast_wait(3).until(EC.invisibility_of_element_located((By.ID, "onetrust-accept-btn-handler")))
             except:
                 logger.info("No cookie banner found")
             
             # STEP 1: Click "Pieteikties" span
             logger.info("STEP 1: Clicking 'Pieteikties'...")
-            login_link = WebDriverWait(self.driver, 10).until(
+            login_link = self.fast_wait(10).until(
                 EC.element_to_be_clickable((By.XPATH, "//span[contains(text(), 'Pieteikties')]"))
             )
             self.driver.execute_script("arguments[0].click();", login_link)
             logger.info("✓ Clicked 'Pieteikties'")
-            time.sleep(4)
             
             # STEP 2: Click "e-pasta adrese" span
             logger.info("STEP 2: Clicking 'e-pasta adrese'...")
-            email_option_button = WebDriverWait(self.driver, 10).until(
+            email_option_button = self.fast_wait(10).until(
                 EC.element_to_be_clickable((By.XPATH, "//span[contains(text(), 'e-pasta')]"))
             )
             self.driver.execute_script("arguments[0].click();", email_option_button)
             logger.info("✓ Clicked 'e-pasta adrese'")
-            time.sleep(3)
             
             # STEP 3: Fill email and password
             logger.info("STEP 3: Filling login form...")
-            email_input = WebDriverWait(self.driver, 10).until(
+            email_input = self.fast_wait(10).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder*='E-pasta'], input[id='username'], input[id='email']"))
             )
             
@@ -240,10 +584,7 @@ class VintedPriceBot:
                 except Exception as e:
                     logger.error(f"Could not list inputs: {e}")
                 
-                # Save page source for debugging
-                with open('/tmp/vinted_login_page.html', 'w', encoding='utf-8') as f:
-                    f.write(self.driver.page_source)
-                logger.error("Page source saved to /tmp/vinted_login_page.html")
+                self.save_debug_page('/tmp/vinted_login_page.html')
                 raise Exception("Email input not found")
             
             # Fill email with proper event triggering
@@ -255,9 +596,8 @@ class VintedPriceBot:
                 arguments[0].dispatchEvent(new Event('change', { bubbles: true }));
             """, email_input)
             logger.info("✓ Email entered")
-            time.sleep(1)
             
-            password_input = WebDriverWait(self.driver, 10).until(
+            password_input = self.fast_wait(10).until(
                 EC.presence_of_element_located((By.ID, "password"))
             )
             password_input.clear()
@@ -268,7 +608,13 @@ class VintedPriceBot:
                 arguments[0].dispatchEvent(new Event('change', { bubbles: true }));
             """, password_input)
             logger.info("✓ Password entered")
-            time.sleep(2)  # Wait a bit longer for any validation
+            # Wait for client-side validation to enable the submit button
+            try:
+                self.fast_wait(3).until(
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']"))
+                )
+            except TimeoutException:
+                pass  # Other submit selectors and methods are tried below
             
             # Check for captcha
             try:
@@ -329,7 +675,16 @@ class VintedPriceBot:
                 try:
                     logger.info(f"Trying: {method_name}")
                     submit_func()
-                    time.sleep(2)  # Brief wait after submission
+                    # Wait briefly for either navigation or a validation message
+                    try:
+                        self.fast_wait(3).until(
+                            lambda d: d.current_url != pre_submit_url or any(
+                                e.is_displayed() and e.text.strip()
+                                for e in d.find_elements(By.CSS_SELECTOR, ".form__error, .error, [class*='error']")
+                            )
+                        )
+                    except WebDriverException:
+                        pass  # Timeout or elements gone stale mid-navigation - the redirect wait below decides
                     
                     # Check for immediate validation errors
                     try:
@@ -344,7 +699,7 @@ class VintedPriceBot:
                     # Wait for redirect
                     logger.info(f"Waiting for redirect after {method_name}...")
                     try:
-                        WebDriverWait(self.driver, 10).until(
+                        self.fast_wait(10).until(
                             lambda d: '/signup' not in d.current_url and '/login' not in d.current_url and d.current_url != pre_submit_url
                         )
                         logger.info(f"✓ Redirected to: {self.driver.current_url}")
@@ -357,7 +712,13 @@ class VintedPriceBot:
                     logger.warning(f"{method_name} failed: {e}")
                     continue
             
-            time.sleep(3)  # Additional wait for page to stabilize
+            # Let the post-login page's DOM load before inspecting it (subresources aren't needed)
+            try:
+                self.fast_wait(10).until(
+                    lambda d: d.execute_script("return document.readyState") != "loading"
+                )
+            except TimeoutException:
+                pass
             
             # Verify login success
             current_url = self.driver.current_url
@@ -420,9 +781,8 @@ class VintedPriceBot:
                 except:
                     pass
                 
-                with open('/tmp/vinted_login_failed.html', 'w', encoding='utf-8') as f:
-                    f.write(self.driver.page_source)
-                logger.error("Login verification failed. Page source saved.")
+                logger.error("Login verification failed.")
+                self.save_debug_page('/tmp/vinted_login_failed.html')
                 
                 # More helpful error message
                 if visible_errors:
@@ -431,9 +791,16 @@ class VintedPriceBot:
                     raise Exception("Login failed - form not submitting. This could be: 1) Wrong credentials, 2) Captcha required, 3) Anti-bot detection, 4) Form validation issue")
             else:
                 logger.info("✓ Successfully logged in!")
-                # Wait longer to ensure session cookies are fully set
+                # Wait until the session cookie is set (or the logged-in user menu renders)
                 logger.info("Waiting for session to stabilize...")
-                time.sleep(5)
+                try:
+                    self.fast_wait(10).until(
+                        lambda d: any('session' in c['name'].lower() for c in d.get_cookies())
+                        or d.find_elements(By.CSS_SELECTOR, "[data-testid='user-menu-button']")
+                    )
+                except TimeoutException:
+                    logger.warning("⚠️ Session cookie not seen yet - continuing anyway")
+                self.save_session_cookies()
             
         except Exception as e:
             logger.error(f"Failed to login to Vinted: {e}")
@@ -446,122 +813,86 @@ class VintedPriceBot:
         items = []
         
         try:
+            # The JSON API returns the listings without rendering anything - try it with a
+            # plain HTTP session first, then with the browser's cookies, then scrape the DOM
+            api_items = self.fetch_items_from_api()
+            if api_items:
+                logger.info(f"Successfully fetched {len(api_items)} items from the Vinted API")
+                return api_items
+            
             self.driver.get(self.vinted_profile_url)
-            time.sleep(5)
             
-            # Scrape items WHILE scrolling (Vinted unloads items as you scroll down)
+            api_items = self.fetch_items_from_api(self.driver)
+            if api_items:
+                logger.info(f"Successfully fetched {len(api_items)} items from the Vinted API")
+                return api_items
+            
+            try:
+                self.fast_wait(15).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid*='--overlay-link']"))
+                )
+            except TimeoutException:
+                logger.warning("No item links appeared on the profile page")
+            
+            # Scrape items WHILE scrolling (Vinted unloads items as you scroll down) - the page
+            # scrolls and collects cards itself every 500ms and resolves once no new cards
+            # turn up for 6s, so there are no fixed sleeps between scrolls
             logger.info("Scrolling and collecting items incrementally...")
+            self.driver.set_script_timeout(SCROLL_MAX_SECONDS + 10)
+            cards = self.driver.execute_script(LISTING_SCROLL_JS, SCROLL_MAX_SECONDS, SCROLL_IDLE_TICKS)
             
             processed_ids = set()  # Track which items we've already scraped
-            scroll_attempts = 0
-            max_scrolls = 20
-            no_new_items_count = 0
+            scraped_lines = []  # Logged once at the end instead of one line per item
             
-            while scroll_attempts < max_scrolls and no_new_items_count < 3:
-                # Find all currently visible item links
-                item_links = self.driver.find_elements(By.CSS_SELECTOR, "[data-testid*='--overlay-link']")
-                
-                items_found_this_scroll = 0
-                
-                for link in item_links:
-                    try:
-                        # Get item ID from data-testid (format: "product-item-id-7819896031--overlay-link")
-                        testid = link.get_attribute('data-testid')
-                        if testid and 'product-item-id-' in testid:
-                            item_id = testid.replace('product-item-id-', '').split('--')[0]
+            for testid, item_url, title, price_text in cards:
+                try:
+                    if not item_url or '/items/' not in item_url:
+                        continue
+                    # Get item ID from data-testid (format: "product-item-id-7819896031--overlay-link")
+                    if testid and 'product-item-id-' in testid:
+                        item_id = testid.replace('product-item-id-', '').split('--')[0]
+                    else:
+                        item_id = item_url.split('/items/')[-1].split('-')[0]
+                    
+                    # Skip if already processed
+                    if item_id in processed_ids:
+                        continue
+                    
+                    # Title attribute holds "title, brand, size, ..." - keep the title part
+                    clean_title = title.split(',')[0] if title else f"Item {item_id}"
+                    
+                    # Price text comes from the card container (e.g., "€13.00" or "13.00")
+                    if price_text and price_text.strip():
+                        price = _parse_price(price_text)
+                    else:
+                        # Price element missing or not rendered yet - the title attribute usually ends with the price
+                        m = _TITLE_PRICE_RE.search(_DIGIT_GROUP_RE.sub('', title or ''))
+                        if m:
+                            price = float(m.group(1).replace(',', '.'))
                         else:
-                            item_url = link.get_attribute('href')
-                            if not item_url or '/items/' not in item_url:
-                                continue
-                            item_id = item_url.split('/items/')[-1].split('-')[0]
-                        
-                        # Skip if already processed
-                        if item_id in processed_ids:
-                            continue
-                        
-                        # Get item URL
-                        item_url = link.get_attribute('href')
-                        if not item_url or '/items/' not in item_url:
-                            continue
-                        
-                        # Get title from the title attribute
-                        title = link.get_attribute('title')
-                        clean_title = title.split(',')[0] if title else f"Item {item_id}"
-                        
-                        # Get price - search within the parent container, not the whole page
-                        price = 0.0
-                        try:
-                            # Find the parent container that holds both link and price
-                            parent = link.find_element(By.XPATH, '../..')
-                            # Now find price within this container
-                            price_element = parent.find_element(By.CSS_SELECTOR, f"[data-testid='product-item-id-{item_id}--price-text']")
-                            
-                            # Wait for text to be present (Vinted lazy-loads prices)
-                            price_text = price_element.text.strip()
-                            attempts = 0
-                            while not price_text and attempts < 5:
-                                time.sleep(0.1)  # Wait for lazy load
-                                price_text = price_element.text.strip()
-                                attempts += 1
-                            
-                            if price_text:
-                                # Remove € symbol and parse (e.g., "€13.00" or "13.00")
-                                price_text = price_text.replace('€', '').replace(',', '.').strip()
-                                price = float(price_text)
-                            else:
-                                # Price element exists but still empty - item may not be fully loaded yet
-                                # Try one more time with JavaScript
-                                try:
-                                    price_text = self.driver.execute_script("return arguments[0].textContent;", price_element).strip()
-                                    if price_text:
-                                        price_text = price_text.replace('€', '').replace(',', '.').strip()
-                                        price = float(price_text)
-                                    else:
-                                        logger.warning(f"Price element found but empty for item {item_id}")
-                                        price = 0.0
-                                except:
-                                    logger.warning(f"Price element found but empty for item {item_id}")
-                                    price = 0.0
-                        except NoSuchElementException:
-                            logger.warning(f"Price element not found for item {item_id}")
-                            price = 0.0
-                        except Exception as e:
-                            logger.warning(f"Error getting price for item {item_id}: {e}")
+                            logger.warning(f"No price found for item {item_id}")
                             price = 0.0
-                        
-                        # Ensure URL is absolute
-                        if not item_url.startswith('http'):
-                            item_url = f"https://www.vinted.lv{item_url}"
-                        
-                        items.append({
-                            'id': item_id,
-                            'title': clean_title,
-                            'price': price,
-                            'url': item_url
-                        })
-                        
-                        processed_ids.add(item_id)
-                        items_found_this_scroll += 1
-                        logger.info(f"Scraped: {clean_title} - €{price} (ID: {item_id})")
-                        
-                    except Exception as e:
-                        logger.warning(f"Failed to parse item link: {e}")
-                        continue
-                
-                # Track if we found new items
-                if items_found_this_scroll == 0:
-                    no_new_items_count += 1
-                else:
-                    no_new_items_count = 0
-                
-                logger.info(f"Scroll {scroll_attempts + 1}: Found {items_found_this_scroll} new items (Total: {len(items)})")
-                
-                # Scroll down
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                scroll_attempts += 1
+                    
+                    # Ensure URL is absolute
+                    if not item_url.startswith('http'):
+                        item_url = f"https://www.vinted.lv{item_url}"
+                    
+                    items.append({
+                        'id': item_id,
+                        'title': clean_title,
+                        'price': price,
+                        'url': item_url
+                    })
+                    
+                    processed_ids.add(item_id)
+                    scraped_lines.append(f"  {clean_title} - €{price} (ID: {item_id})")
+                    
+                except Exception as e:
+                    logger.warning(f"Failed to parse item link: {e}")
+                    continue
             
-            logger.info(f"Completed scrolling after {scroll_attempts} scrolls")
+            if scraped_lines:
+                logger.info("Scraped %d items:\n%s", len(scraped_lines), "\n".join(scraped_lines))
             
             logger.info(f"Successfully scraped {len(items)} items")
             return items
@@ -570,330 +901,371 @@ class VintedPriceBot:
             logger.error(f"Failed to fetch items: {e}")
             raise
             
-    def sync_with_google_sheets(self, items: List[Dict]):
-        """Sync items with Google Sheets and get price change percentages"""
-        logger.info("Syncing with Google Sheets...")
+    def create_api_session(self, driver: webdriver.Chrome = None) -> requests.Session:
+        """Build a requests session for Vinted's API - with a browser's cookies, or fresh anonymous ones"""
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept': 'application/json',
+        })
+        if driver:
+            for cookie in driver.get_cookies():
+                session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+        else:
+            # The homepage hands out the anonymous session cookies the API expects
+            session.get("https://www.vinted.lv", headers={'Accept': 'text/html'}, timeout=20)
+        return session
+        
+    def fetch_items_from_api(self, driver: webdriver.Chrome = None) -> Optional[List[Dict]]:
+        """Fetch listed items from the Vinted JSON API (None if it is unavailable)"""
+        if not self.profile_id:
+            return None
         
-        # Get existing data before setting headers (in case sheet has old format)
-        existing_dict = {}
         try:
-            existing_data = self.sheet.get_all_records()
-            existing_dict = {str(row.get('Item ID', '')): row for row in existing_data if row.get('Item ID')}
-        except Exception as e:
-            logger.warning(f"Could not read existing sheet data (may have duplicate headers): {e}")
-            # Try to read manually by getting all values
-            try:
-                all_values = self.sheet.get_all_values()
-                if len(all_values) > 1:
-                    # Find the header row with 'Item ID'
-                    header_row = None
-                    for idx, row in enumerate(all_values):
-                        if 'Item ID' in row:
-                            header_row = idx
-                            headers = row
-                            break
-                    
-                    if header_row is not None and len(all_values) > header_row + 1:
-                        # Parse manually
-                        item_id_col = headers.index('Item ID')
-                        for row in all_values[header_row + 1:]:
-                            if len(row) > item_id_col and row[item_id_col]:
-                                item_id = str(row[item_id_col])
-                                existing_dict[item_id] = {
-                                    'Item ID': row[item_id_col] if len(row) > item_id_col else '',
-                                    'URL': row[headers.index('URL')] if 'URL' in headers and len(row) > headers.index('URL') else '',
-                                    'Title': row[headers.index('Title')] if 'Title' in headers and len(row) > headers.index('Title') else '',
-                                    'Current Price': row[headers.index('Current Price')] if 'Current Price' in headers and len(row) > headers.index('Current Price') else 0,
-                                    'New Price': row[headers.index('New Price')] if 'New Price' in headers and len(row) > headers.index('New Price') else 0,
-                                    'Price Change %': row[headers.index('Price Change %')] if 'Price Change %' in headers and len(row) > headers.index('Price Change %') else '',
-                                    'Floor Price': row[headers.index('Floor Price')] if 'Floor Price' in headers and len(row) > headers.index('Floor Price') else '',
-                                    'Status': row[headers.index('Status')] if 'Status' in headers and len(row) > headers.index('Status') else '',
-                                    'Last Updated': row[headers.index('Last Updated')] if 'Last Updated' in headers and len(row) > headers.index('Last Updated') else ''
-                                }
-                        logger.info(f"Manually parsed {len(existing_dict)} existing items from sheet")
-            except Exception as e2:
-                logger.warning(f"Could not manually parse sheet data: {e2}")
-                existing_dict = {}
-        
-        # Get current item IDs from Vinted
-        current_item_ids = {item['id'] for item in items}
-        
-        # Detect changes
-        new_items = []
-        updated_items = []
-        removed_item_ids = []
-        
-        # Check for new and updated items
-        for item in items:
-            item_id = item['id']
-            if item_id in existing_dict:
-                updated_items.append(item_id)
+            session = self.create_api_session(driver)
+            items = []
+            seen_ids = set()
+            for page in range(1, API_MAX_PAGES + 1):
+                response = session.get(
+                    f"https://www.vinted.lv/api/v2/users/{self.profile_id}/items",
+                    params={'per_page': API_PAGE_SIZE, 'page': page},
+                    timeout=20,
+                )
+                response.raise_for_status()
+                data = response.json()
+                entries = data.get('items', [])
+                
+                new_on_page = 0
+                for entry in entries:
+                    item_id = str(entry['id'])
+                    if item_id in seen_ids:
+                        continue
+                    seen_ids.add(item_id)
+                    new_on_page += 1
+                    # Price is {"amount": "13.0", "currency_code": "EUR"} on current API versions
+                    price = entry.get('price')
+                    if isinstance(price, dict):
+                        price = price.get('amount')
+                    item_url = entry.get('url') or f"https://www.vinted.lv/items/{item_id}"
+                    if not item_url.startswith('http'):
+                        item_url = f"https://www.vinted.lv{item_url}"
+                    items.append({
+                        'id': item_id,
+                        'title': entry.get('title') or f"Item {item_id}",
+                        'price': _to_float(price, 0.0),
+                        'url': item_url
+                    })
+                
+                # Stop on the last page - per the pagination info, or a short page if it's missing -
+                # and on a page with nothing new (the API ignoring `page` would repeat itself)
+                total_pages = (data.get('pagination') or {}).get('total_pages')
+                if total_pages:
+                    if page >= total_pages:
+                        break
+                elif len(entries) < API_PAGE_SIZE:
+                    break
+                if not new_on_page:
+                    break
             else:
-                new_items.append(item_id)
+                logger.warning(f"Stopped Vinted API paging after {API_MAX_PAGES} pages")
+            return items
+        except Exception as e:
+            logger.warning(f"Vinted API request failed ({'browser' if driver else 'plain'} session): {e}")
+            return None
+            
+    def calculate_new_price(self, item: Dict, sheet_row: Optional[Dict]) -> float:
+        """Apply the sheet's price change % and floor price to a scraped item"""
+        current_price = item['price']
+        is_new_item = sheet_row is None
+        
+        # Check if item exists in sheet
+        if not is_new_item:
+            # EXISTING ITEM - use sheet settings (already parsed to numbers)
+            # Get the percentage from sheet, use default if empty
+            price_change_percent = sheet_row['Price Change %']
+            if price_change_percent is None:
+                price_change_percent = self.default_percent
+            
+            # Get floor price if set
+            floor_price = sheet_row['Floor Price']
+        else:
+            # NEW ITEM - Don't change price on first discovery
+            price_change_percent = 0  # 0% change = no price update
+            floor_price = None
+            logger.info("   🆕 NEW ITEM DISCOVERED: %s - Price will NOT be changed this run", item['title'])
         
-        # Check for removed items (in sheet but not on Vinted)
-        for item_id in existing_dict.keys():
-            if item_id not in current_item_ids:
-                removed_item_ids.append(item_id)
+        # Calculate new price
+        new_price = round(current_price * (1 + price_change_percent / 100), 2)
+        
+        # Apply floor price if set
+        if floor_price is not None and new_price < floor_price:
+            logger.info("   Floor price applied for %s: €%.2f → €%.2f", item['title'], new_price, floor_price)
+            new_price = floor_price
+        
+        # Store item data with calculated new price
+        item['new_price'] = new_price
+        item['price_change_percent'] = price_change_percent
+        item['floor_price'] = floor_price if floor_price is not None else ''
+        item['is_new_discovery'] = is_new_item  # Flag for later use
+        
+        return new_price
+        
+    def build_sheet_row(self, item: Dict, timestamp: str) -> List:
+        """Build the sheet row for a priced item (see calculate_new_price)"""
+        is_new_item = item['is_new_discovery']
+        return [
+            item['id'],
+            item.get('url', ''),
+            item['title'],
+            item['price'],
+            item['new_price'],
+            item['floor_price'],
+            item['price_change_percent'] if not is_new_item else self.default_percent,
+            '🆕 New' if is_new_item else 'Active',
+            timestamp
+        ]
         
+    def sync_with_google_sheets(self, items: List[Dict]) -> List[Dict]:
+        """Sync items with Google Sheets; returns the items needing a price change"""
+        logger.info("Syncing with Google Sheets...")
+        
+        # One timestamp for every row written in this sync
+        now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Read the sheet once (raw values) - existing_dict and the row map both come from it
+        existing_dict = {}  # item_id -> parsed row
+        existing_row_map = {}  # item_id -> row_number (1-based, including header)
+        write_header = False
+        stale_row_count = 0  # Rows of old content to blank out when (re)creating the sheet
+        last_row = 1  # Header row
+        try:
+            all_values = _sheets_call(self.sheet.get_values, value_render_option='UNFORMATTED_VALUE')
+            
+            # Find the header row with 'Item ID' (sheet may have an old format above it)
+            header_row_idx = next((idx for idx, row in enumerate(all_values) if 'Item ID' in row), None)
+            
+            if header_row_idx is None:
+                # No header found, need to create sheet from scratch - the header and
+                # blanking of old rows go out with the single batch write below (no clear())
+                logger.info("No header found, creating new sheet...")
+                write_header = True
+                stale_row_count = len(all_values)
+            else:
+                # Missing columns fall back to defaults in _parse_sheet_record
+                columns = _column_index(all_values[header_row_idx])
+                item_id_col = columns['Item ID']
+                for row_number, row in enumerate(all_values[header_row_idx + 1:], start=header_row_idx + 2):  # +2 because 1-based and skip header
+                    if len(row) > item_id_col and row[item_id_col]:
+                        item_id = str(row[item_id_col])
+                        existing_dict[item_id] = _parse_sheet_record(
+                            {name: row[col] for name, col in columns.items() if len(row) > col}
+                        )
+                        existing_row_map[item_id] = row_number
+                last_row = len(all_values)
+                logger.info(f"Read {len(existing_dict)} existing items from sheet")
+        except Exception as e:
+            # Without the existing rows every item would look new and be written from
+            # row 2 down, over the sheet - abort the sync instead
+            logger.error(f"Could not read existing sheet data: {e}")
+            raise
+        
+        # Index current Vinted items by ID once - logging and the change mask both look items up
+        items_by_id = {item['id']: item for item in items}
+        current_item_ids = items_by_id.keys()
+        existing_ids = existing_dict.keys()
+
+        # Detect changes (set operations instead of per-item membership loops)
+        new_items = current_item_ids - existing_ids
+        updated_items = current_item_ids & existing_ids
+        removed_item_ids = existing_ids - current_item_ids  # In sheet but not on Vinted
+        # Rows already marked sold (and formatted red) in an earlier run need no writes
+        newly_removed_ids = [item_id for item_id in removed_item_ids if not existing_dict[item_id]['Status'].startswith('❌')]
+
         # Log changes
         if new_items:
             logger.info(f"🆕 New items found: {len(new_items)} (prices will NOT change until next run)")
             for item_id in new_items:
-                item = next((i for i in items if i['id'] == item_id), None)
-                if item:
-                    logger.info(f"   + {item['title']} (€{item['price']})")
+                item = items_by_id[item_id]
+                logger.info("   + %s (€%s)", item['title'], item['price'])
         
         if removed_item_ids:
             logger.info(f"🗑️  Removed items (likely sold): {len(removed_item_ids)}")
             for item_id in removed_item_ids:
-                if item_id in existing_dict:
-                    logger.info(f"   - {existing_dict[item_id].get('Title', 'Unknown')}")
+                logger.info("   - %s", existing_dict[item_id].get('Title', 'Unknown'))
         
-        if not new_items and not removed_item_ids:
+        if not (new_items or removed_item_ids):
             logger.info("ℹ️  No new or removed items")
         
-        # Get all existing rows to find row numbers for updates
-        try:
-            all_values = self.sheet.get_all_values()
-            header_row_idx = None
-            for idx, row in enumerate(all_values):
-                if 'Item ID' in row:
-                    header_row_idx = idx
-                    break
-            
-            if header_row_idx is None:
-                # No header found, need to create sheet from scratch
-                logger.info("No header found, creating new sheet...")
-                self.sheet.clear()
-                header = ['Item ID', 'URL', 'Title', 'Current Price', 'New Price', 'Floor Price', 'Price Change %', 'Status', 'Last Updated']
-                self.sheet.update(values=[header], range_name='A1')
-                header_row_idx = 0
-                existing_row_map = {}  # item_id -> row_number (1-based, including header)
-            else:
-                # Map existing item IDs to their row numbers (1-based, including header)
-                headers = all_values[header_row_idx]
-                item_id_col = headers.index('Item ID') if 'Item ID' in headers else 0
-                existing_row_map = {}
-                for idx, row in enumerate(all_values[header_row_idx + 1:], start=header_row_idx + 2):  # +2 because 1-based and skip header
-                    if len(row) > item_id_col and row[item_id_col]:
-                        existing_row_map[str(row[item_id_col])] = idx
-        except Exception as e:
-            logger.warning(f"Could not read existing rows: {e}")
-            existing_row_map = {}
-            header_row_idx = 0
+        # Remember where every item lives so price updates can be written back
+        # (set before the digest check - the skip path below needs it too)
+        self.sheet_rows = dict(existing_row_map)
         
-        # Process items: update existing rows or prepare new rows
-        rows_to_update = {}  # row_number -> row_data
-        new_rows_to_append = []  # List of new rows to append
+        # Skip change detection and the write phase when neither Vinted nor the
+        # sheet changed since the last sync - prices are still recalculated for run()
+        sync_digest = _sync_fingerprint(items, existing_dict)
+        if sync_digest == self.load_sync_digest():
+            logger.info("ℹ️  Vinted items and sheet unchanged since last sync - skipping sheet update")
+            for item in items:
+                self.calculate_new_price(item, existing_dict.get(item['id']))
+            return _pending_price_updates(items)
         
-        # Process current items from Vinted
+        # Pass 1: calculate new prices for current items from Vinted
         for item in items:
-            item_id = item['id']
-            current_price = item['price']
-            is_new_item = item_id not in existing_dict
-            
-            # Check if item exists in sheet
-            if not is_new_item:
-                # EXISTING ITEM - use sheet settings
-                # Get the percentage from sheet, use default if empty
-                percent_str = str(existing_dict[item_id].get('Price Change %', '')).strip()
-                
-                if percent_str and percent_str != '':
-                    try:
-                        price_change_percent = float(percent_str)
-                    except:
-                        price_change_percent = self.default_percent
-                else:
-                    price_change_percent = self.default_percent
-                
-                # Get floor price if set
-                floor_price_str = str(existing_dict[item_id].get('Floor Price', '')).strip()
-                if floor_price_str and floor_price_str != '':
-                    try:
-                        floor_price = float(floor_price_str)
-                    except:
-                        floor_price = None
-                else:
-                    floor_price = None
-                
-                status = 'Active'
-            else:
-                # NEW ITEM - Don't change price on first discovery
-                price_change_percent = 0  # 0% change = no price update
-                floor_price = None
-                status = '🆕 New'
-                logger.info(f"   🆕 NEW ITEM DISCOVERED: {item['title']} - Price will NOT be changed this run")
-            
-            # Calculate new price
-            new_price = round(current_price * (1 + price_change_percent / 100), 2)
-            
-            # Apply floor price if set
-            if floor_price is not None and new_price < floor_price:
-                logger.info(f"   Floor price applied for {item['title']}: €{new_price:.2f} → €{floor_price:.2f}")
-                new_price = floor_price
-            
-            # Store item data with calculated new price
-            item['new_price'] = new_price
-            item['price_change_percent'] = price_change_percent
-            item['floor_price'] = floor_price if floor_price is not None else ''
-            item['is_new_discovery'] = is_new_item  # Flag for later use
-            
-            row_data = [
-                item_id,
-                item.get('url', ''),
-                item['title'],
-                current_price,
-                new_price,
-                floor_price if floor_price is not None else '',
-                price_change_percent if not is_new_item else self.default_percent,
-                status,
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            ]
-            
-            # If item exists in sheet, check if data changed before updating
-            if item_id in existing_row_map:
-                # Only update if data actually changed
-                old_data = existing_dict[item_id]
-                
-                # Safely convert prices to float (handle strings, empty values, etc.)
-                try:
-                    old_price = float(str(old_data.get('Current Price', 0) or 0).replace(',', '.'))
-                except:
-                    old_price = 0.0
-                
-                try:
-                    old_new_price = float(str(old_data.get('New Price', 0) or 0).replace(',', '.'))
-                except:
-                    old_new_price = 0.0
-                
-                old_status = str(old_data.get('Status', '')).strip()
-                
-                # Check if anything meaningful changed (ignore timestamp)
-                # Only update if the CURRENT PRICE changed (not just recalculated new_price)
-                # Use tolerance to account for rounding differences
-                price_changed = abs(old_price - current_price) > 0.05  # 5 cent tolerance
-                status_changed = old_status != status
-                
-                # Also check if title or URL changed (shouldn't happen, but just in case)
-                old_title = str(old_data.get('Title', '')).strip()
-                old_url = str(old_data.get('URL', '')).strip()
-                title_changed = old_title != item['title']
-                url_changed = old_url != item.get('url', '')
-                
-                # Only update if CURRENT PRICE or STATUS changed (not just recalculated new_price)
-                # This prevents unnecessary updates when only order changes
-                if price_changed or status_changed or title_changed or url_changed:
-                    # Data changed - add to update list
+            self.calculate_new_price(item, existing_dict.get(item['id']))
+        
+        changed_ids = []  # Existing rows whose data differs from Vinted
+        
+        # Pass 2: change mask over rows already in the sheet - only rows that
+        # differ from what Vinted shows now are rewritten
+        for item_id in updated_items & existing_row_map.keys():
+            item = items_by_id[item_id]
+            old_data = existing_dict[item_id]
+            
+            # Prices were converted to float and text stripped when the sheet was read
+            old_price = old_data['Current Price']
+            old_status = old_data['Status']
+            
+            # Check if anything meaningful changed (ignore timestamp)
+            # Only update if the CURRENT PRICE changed (not just recalculated new_price)
+            # Prices are written as RAW numbers, so only float noise needs tolerating
+            price_changed = abs(old_price - item['price']) > 0.005  # Half a cent
+            status_changed = old_status != 'Active'
+            
+            # Also check if title or URL changed (shouldn't happen, but just in case)
+            title_changed = old_data['Title'] != item['title']
+            url_changed = old_data['URL'] != item.get('url', '')
+            
+            # Only update if CURRENT PRICE or STATUS changed (not just recalculated new_price)
+            # This prevents unnecessary updates when only order changes
+            if price_changed or status_changed or title_changed or url_changed:
+                # Data changed - add to update list
+                changed_ids.append(item_id)
+                # Only describe the change when DEBUG output is actually enabled
+                if logger.isEnabledFor(logging.DEBUG):
                     changes = []
                     if price_changed:
-                        changes.append(f"current_price: {old_price}→{current_price}")
+                        changes.append(f"current_price: {old_price}→{item['price']}")
                     if status_changed:
-                        changes.append(f"status: {old_status}→{status}")
+                        changes.append(f"status: {old_status}→Active")
                     if title_changed:
-                        changes.append(f"title changed")
+                        changes.append("title changed")
                     if url_changed:
-                        changes.append(f"url changed")
-                    logger.debug(f"Item {item_id} changed: {', '.join(changes)}")
-                    rows_to_update[existing_row_map[item_id]] = row_data
-                # else: skip update - no changes needed
-            else:
-                # New item - always append
-                new_rows_to_append.append(row_data)
-        
-        # Process removed items - update their status to sold/removed
-        for item_id in removed_item_ids:
-            if item_id in existing_dict:
-                old_data = existing_dict[item_id]
-                if item_id in existing_row_map:
-                    # Update existing row to mark as sold
-                    rows_to_update[existing_row_map[item_id]] = [
-                        item_id,
-                        old_data.get('URL', ''),
-                        old_data.get('Title', 'Unknown'),
-                        old_data.get('Current Price', 0),
-                        old_data.get('New Price', 0),
-                        old_data.get('Floor Price', ''),
-                        0,  # Set Price Change % to 0 for sold items
-                        '❌ Sold/Removed',
-                        datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    ]
-        
-        # Update existing rows in batches to avoid rate limits (60 writes/min = 1 per second)
+                        changes.append("url changed")
+                    logger.debug("Item %s changed: %s", item_id, ', '.join(changes))
+            # else: skip update - no changes needed
+        
+        # Build sheet rows only for what will actually be written
+        rows_to_update = {existing_row_map[item_id]: self.build_sheet_row(items_by_id[item_id], now_str) for item_id in changed_ids}  # row_number -> row_data
+        new_rows_to_append = [self.build_sheet_row(item, now_str) for item in items if item['id'] not in existing_row_map]  # New items - always append
+        
+        # Process newly removed items - update their status to sold/removed
+        for item_id in newly_removed_ids:
+            old_data = existing_dict[item_id]
+            if item_id in existing_row_map:
+                # Update existing row to mark as sold
+                rows_to_update[existing_row_map[item_id]] = [
+                    item_id,
+                    old_data.get('URL', ''),
+                    old_data.get('Title', 'Unknown'),
+                    old_data['Current Price'],
+                    old_data['New Price'],
+                    old_data['Floor Price'] if old_data['Floor Price'] is not None else '',
+                    0,  # Set Price Change % to 0 for sold items
+                    '❌ Sold/Removed',
+                    now_str
+                ]
+        
+        # Values and sold-row formatting go out in a single spreadsheets.batchUpdate request -
+        # it counts as ONE write against the 60 writes/min quota, so no sleeps are needed
+        sheet_requests = []
+        sheet_id = self.sheet.id
+        
         if rows_to_update:
             logger.info(f"Updating {len(rows_to_update)} rows that changed (out of {len(existing_row_map)} total)...")
             sorted_rows = sorted(rows_to_update.items())
             
-            # Group consecutive rows together for batch updates
-            groups = []
-            if sorted_rows:
-                current_group = [sorted_rows[0]]
-                for i in range(1, len(sorted_rows)):
-                    if sorted_rows[i][0] == sorted_rows[i-1][0] + 1:
-                        # Consecutive row - add to current group
-                        current_group.append(sorted_rows[i])
-                    else:
-                        # Gap found - start new group
-                        groups.append(current_group)
-                        current_group = [sorted_rows[i]]
-                groups.append(current_group)
-            
-            # Update each group (consecutive rows can be updated in one API call)
-            for group_idx, group in enumerate(groups):
-                if len(group) == 1:
-                    # Single row
-                    row_num, row_data = group[0]
-                    range_name = f'A{row_num}:I{row_num}'
-                    self.sheet.update(values=[row_data], range_name=range_name)
-                else:
-                    # Multiple consecutive rows - update in one call
-                    min_row = group[0][0]
-                    max_row = group[-1][0]
-                    range_name = f'A{min_row}:I{max_row}'
-                    row_dict = {row_num: row_data for row_num, row_data in group}
-                    batch_values = [row_dict[r] for r in range(min_row, max_row + 1)]
-                    self.sheet.update(values=batch_values, range_name=range_name)
-                
-                # Add delay between groups to stay under rate limit (1 request per second)
-                if group_idx < len(groups) - 1:
-                    time.sleep(1.1)  # Wait 1.1 seconds between groups
+            # Group consecutive rows together so each group becomes one updateCells request
+            # (row_number - position is constant within a run of consecutive rows)
+            groups = [
+                [row for _, row in group]
+                for _, group in groupby(enumerate(sorted_rows), key=lambda p: p[1][0] - p[0])
+            ]
+            
+            sheet_requests.extend(
+                _update_cells_request(sheet_id, group[0][0], [row_data for _, row_data in group])
+                for group in groups
+            )
         
-        # Append new rows
+        if write_header:
+            sheet_requests.append(_update_cells_request(sheet_id, 1, [SHEET_HEADER]))
+            # Bold header on a light grey background, sent with the values
+            sheet_requests.append({
+                'repeatCell': {
+                    'range': {
+                        'sheetId': sheet_id,
+                        'startRowIndex': 0,
+                        'endRowIndex': 1,
+                        'startColumnIndex': 0,
+                        'endColumnIndex': len(SHEET_HEADER)
+                    },
+                    'cell': {
+                        'userEnteredFormat': {
+                            'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9},
+                            'textFormat': {'bold': True}
+                        }
+                    },
+                    'fields': 'userEnteredFormat(backgroundColor,textFormat)'
+                }
+            })
+        
+        # Append new rows after the last row read above
         if new_rows_to_append:
             logger.info(f"Appending {len(new_rows_to_append)} new rows...")
-            # Find the last row
-            try:
-                all_values = self.sheet.get_all_values()
-                last_row = len(all_values)
-            except:
-                last_row = 1  # Header row
-            
-            # Append all new rows at once
-            range_name = f'A{last_row + 1}:I{last_row + len(new_rows_to_append)}'
-            self.sheet.update(values=new_rows_to_append, range_name=range_name)
+            sheet_requests.append(_update_cells_request(sheet_id, last_row + 1, new_rows_to_append))
+        
+        # Overwrite any leftover rows below the fresh data with blanks
+        first_stale_row = last_row + len(new_rows_to_append) + 1
+        if stale_row_count >= first_stale_row:
+            sheet_requests.append(_update_cells_request(
+                sheet_id, first_stale_row, [[''] * len(SHEET_HEADER)] * (stale_row_count - first_stale_row + 1)
+            ))
         
         # Format sold/removed items in red
-        if removed_item_ids:
-            logger.info(f"Formatting {len(removed_item_ids)} sold items in red...")
-            try:
-                for item_id in removed_item_ids:
-                    if item_id in existing_row_map:
-                        row_num = existing_row_map[item_id]
-                        # Format entire row in red with strikethrough
-                        self.sheet.format(f'A{row_num}:I{row_num}', {
-                            'backgroundColor': {'red': 1.0, 'green': 0.8, 'blue': 0.8},  # Light red
-                            'textFormat': {
-                                'strikethrough': True,
-                                'foregroundColor': {'red': 0.6, 'green': 0.0, 'blue': 0.0}  # Dark red text
-                            }
-                        })
-            except Exception as e:
-                logger.warning(f"Could not format sold items: {e}")
+        if newly_removed_ids:
+            logger.info(f"Formatting {len(newly_removed_ids)} sold items in red...")
+            # Format entire row in red with strikethrough (one shared format for all rows)
+            sold_format = {
+                'backgroundColor': {'red': 1.0, 'green': 0.8, 'blue': 0.8},  # Light red
+                'textFormat': {
+                    'strikethrough': True,
+                    'foregroundColor': {'red': 0.6, 'green': 0.0, 'blue': 0.0}  # Dark red text
+                }
+            }
+            sheet_requests.extend(
+                {
+                    'repeatCell': {
+                        'range': {
+                            'sheetId': sheet_id,
+                            'startRowIndex': existing_row_map[item_id] - 1,
+                            'endRowIndex': existing_row_map[item_id],
+                            'startColumnIndex': 0,
+                            'endColumnIndex': len(SHEET_HEADER)
+                        },
+                        'cell': {'userEnteredFormat': sold_format},
+                        'fields': 'userEnteredFormat(backgroundColor,textFormat)'
+                    }
+                }
+                for item_id in newly_removed_ids
+                if item_id in existing_row_map
+            )
+        
+        if sheet_requests:
+            _sheets_call(self.sheet.spreadsheet.batch_update, {'requests': sheet_requests})
         
         logger.info("✓ Sheet data updated (only new rows added, existing rows updated)")
         
-        # Count new discoveries
-        new_discovery_count = len([i for i in items if i.get('is_new_discovery', False)])
+        # New discoveries are exactly the IDs not yet in the sheet (no extra pass over items)
+        new_discovery_count = len(new_items)
         
         # Calculate total rows in sheet
         total_rows = len(existing_row_map) + len(new_rows_to_append)  # Existing + new
@@ -907,66 +1279,129 @@ class VintedPriceBot:
             logger.info(f"   🗑️  Removed items: {len(removed_item_ids)}")
         logger.info(f"   Total rows in sheet: {total_rows}")
         
-        return items, existing_dict
+        # The digest describes the sheet as read before this sync - it only matches the
+        # sheet as it is now when nothing was written (otherwise a sheet later restored
+        # to the pre-write state, e.g. appended rows deleted, would be skipped for good)
+        if sheet_requests:
+            self.clear_sync_digest()
+        else:
+            self.save_sync_digest(sync_digest)
+        
+        # Appended rows can take price updates too
+        self.sheet_rows.update(
+            (row[0], row_number) for row_number, row in enumerate(new_rows_to_append, start=last_row + 1)
+        )
         
-    def update_item_price(self, item: Dict, existing_dict: Dict = None):
-        """Update price for a single item on Vinted"""
-        logger.info(f"Updating price for: {item['title']}")
+        return _pending_price_updates(items)
         
+    def save_debug_page(self, path: str):
+        """Dump the main driver's page source for debugging (only with VINTED_DEBUG set)"""
+        if not self.debug:
+            return
         try:
-            # Get URL from sheet if available, otherwise use item URL
-            item_id = item['id']
-            if existing_dict and item_id in existing_dict:
-                item_url = existing_dict[item_id].get('URL', '') or item.get('url', '')
-            else:
-                item_url = item.get('url', '')
-            
-            if not item_url:
-                logger.error(f"No URL found for item {item_id}")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(self.driver.page_source)
+            logger.error(f"Page source saved to {path}")
+        except (OSError, WebDriverException) as e:
+            logger.warning(f"Could not save page source: {e}")
+        
+    def restore_session(self) -> bool:
+        """Load saved session cookies into the browser; True if Vinted shows us as logged in"""
+        try:
+            if time.time() - os.path.getmtime(SESSION_COOKIES_FILE) > SESSION_MAX_AGE:
+                logger.info("Saved session is older than 7 days - logging in again")
                 return False
-            
-            logger.info(f"Using URL from sheet: {item_url}")
-            
-            # Establish session by navigating to homepage first
-            logger.info("Navigating to homepage to establish session...")
+            with open(SESSION_COOKIES_FILE, 'r', encoding='utf-8') as f:
+                cookies = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        logger.info("Restoring saved Vinted session...")
+        try:
+            # Cookies can only be added for the domain that is currently open
             self.driver.get("https://www.vinted.lv")
-            time.sleep(2)
-            
-            # Verify we're logged in (not redirected to login)
-            current_url = self.driver.current_url
-            if any(x in current_url for x in ['/login', '/signup', '/signin']):
-                logger.error("⚠️ Session lost - redirected to login from homepage!")
-                return False
-            logger.info("✓ Session verified on homepage")
-            
-            # Now navigate to item page
-            logger.info(f"Navigating to item page: {item_url}")
-            self.driver.get(item_url)
-            time.sleep(3)  # Wait for item page to load
-            
-            # Verify we're on item page (not redirected to login)
-            current_url = self.driver.current_url
-            if any(x in current_url for x in ['/login', '/signup', '/signin']):
-                logger.error("⚠️ Redirected to login from item page - session invalid!")
-                return False
-            logger.info("✓ Item page loaded successfully")
-            
-            # Now navigate to edit page using normal navigation (not JavaScript)
-            edit_url = item_url.rstrip('/') + '/edit'
-            logger.info(f"Navigating to edit page: {edit_url}")
-            self.driver.get(edit_url)
-            time.sleep(2)  # Wait for navigation
-            
-            # Wait for edit page to load
-            WebDriverWait(self.driver, 15).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
+            self.add_session_cookies(self.driver, cookies)
+            self.driver.get("https://www.vinted.lv")
+            self.fast_wait(3).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='user-menu-button']"))
             )
-            time.sleep(3)  # Additional wait for dynamic content
+        except TimeoutException:
+            logger.info("Saved session is no longer valid - logging in again")
+            self.driver.delete_all_cookies()
+            return False
+        except WebDriverException as e:
+            # Page load timeout, a rejected stored cookie... - the form login still works
+            logger.warning(f"Could not restore saved session - logging in again: {e}")
+            try:
+                self.driver.delete_all_cookies()
+            except WebDriverException:
+                pass
+            return False
+        
+        logger.info("✓ Logged in with saved session")
+        return True
+        
+    def save_session_cookies(self):
+        """Save the logged-in session cookies for the next run (owner-readable only)"""
+        try:
+            fd = os.open(SESSION_COOKIES_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.driver.get_cookies(), f)
+        except OSError as e:
+            logger.warning(f"Could not save session cookies: {e}")
+        
+    def load_sync_digest(self) -> Optional[str]:
+        """Read the fingerprint stored by the previous successful sync"""
+        try:
+            with open(SYNC_DIGEST_FILE, 'r', encoding='utf-8') as f:
+                return f.read().strip()
+        except OSError:
+            return None
+        
+    def save_sync_digest(self, digest: str):
+        """Remember the fingerprint of a completed sync for the next run"""
+        try:
+            with open(SYNC_DIGEST_FILE, 'w', encoding='utf-8') as f:
+                f.write(digest)
+        except OSError as e:
+            logger.warning(f"Could not save sync fingerprint: {e}")
+        
+    def clear_sync_digest(self):
+        """Forget the stored fingerprint so the next run does a full sync"""
+        try:
+            os.remove(SYNC_DIGEST_FILE)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove sync fingerprint: {e}")
+        
+    def update_item_price(self, item: Dict, driver: webdriver.Chrome = None):
+        """Update price for a single item on Vinted (using the main driver unless one is given)"""
+        driver = driver or self.driver
+        logger.info("Updating price for: %s", item['title'])
+        
+        try:
+            # Go straight to the edit page (built from the ID, so no URL lookup is needed) -
+            # the item detail page adds a full load per item and tells us nothing the edit
+            # page doesn't (a lost session redirects to login)
+            edit_url = f"https://www.vinted.lv/items/{item['id']}/edit"
+            logger.info("Navigating to edit page: %s", edit_url)
+            driver.get(edit_url)
+            
+            # Wait for the form to render or for a client-side redirect away from /edit -
+            # not for the full load event, which eager page loading lets us skip
+            try:
+                self.cdp_wait_for(
+                    f"document.querySelector({json.dumps(PRICE_INPUT_SELECTOR)}) || !location.pathname.includes('/edit')",
+                    15, driver
+                )
+            except WebDriverException:
+                pass  # Page navigated away mid-wait - handled by the URL check and price input wait below
             
             # DEBUG: Print HTML structure to help locate edit button (check entire page, not just sidebar)
             # Check if we're on the edit page
-            current_url = self.driver.current_url
-            logger.info(f"Current URL: {current_url}")
+            current_url = driver.current_url
+            logger.info("Current URL: %s", current_url)
             
             if '/edit' not in current_url:
                 # We got redirected - check if it's login page
@@ -982,47 +1417,222 @@ class VintedPriceBot:
             
             # Find price input - using exact ID and data-testid
             logger.info("Looking for price input...")
-            price_input = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input#price[data-testid='price-input--input']"))
+            price_input = self.fast_wait(10, driver).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, PRICE_INPUT_SELECTOR))
             )
             current_value = price_input.get_attribute('value')
-            logger.info(f"Price input found with current value: {current_value}")
+            logger.info("Price input found with current value: %s", current_value)
             
             # Clear and enter new price (remove € symbol if present)
             price_input.clear()
-            time.sleep(0.5)
             
             # Format price as Vinted expects (just the number, e.g., "24.50")
             new_price_str = f"{item['new_price']:.2f}"
             price_input.send_keys(new_price_str)
-            logger.info(f"Entered new price: €{new_price_str}")
-            time.sleep(1)
+            logger.info("Entered new price: €%s", new_price_str)
+            try:
+                self.fast_wait(2, driver).until(
+                    EC.text_to_be_present_in_element_value((By.CSS_SELECTOR, PRICE_INPUT_SELECTOR), new_price_str)
+                )
+            except TimeoutException:
+                pass  # The form may re-format the value (e.g. "24,50") - the post-save URL check confirms the update
             
             # Click Save button - using exact data-testid
             logger.info("Looking for Save button...")
-            save_button = WebDriverWait(self.driver, 10).until(
+            save_button = self.fast_wait(10, driver).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "button[data-testid='upload-form-save-button']"))
             )
+            # Compare against the URL the form actually lives on - Vinted may have
+            # canonicalized edit_url (locale, trailing slash, query) on load
+            pre_save_url = driver.current_url
             save_button.click()
             logger.info("Save button clicked")
             
-            time.sleep(3)
+            # Vinted leaves the edit page once the save went through
+            try:
+                self.fast_wait(15, driver).until(EC.url_changes(pre_save_url))
+            except TimeoutException:
+                logger.error(f"⚠️ Still on edit page after save - price for {item['title']} not confirmed")
+                return False
             
             percent_value = float(item.get('price_change_percent', 0))
-            logger.info(f"✓ Price updated: €{item['price']:.2f} → €{item['new_price']:.2f} ({percent_value:.1f}%)")
+            logger.info("✓ Price updated: €%.2f → €%.2f (%.1f%%)", item['price'], item['new_price'], percent_value)
+            self.record_price_update(item)
             
             return True
             
         except Exception as e:
             logger.error(f"Failed to update price for {item['title']}: {e}")
-            # Save screenshot on error
+            # Save screenshot on error (debug runs only, at most one a minute)
+            if self.debug and time.time() - self.last_error_screenshot >= ERROR_SCREENSHOT_INTERVAL:
+                self.last_error_screenshot = time.time()
+                try:
+                    driver.save_screenshot(f'/tmp/price_update_error_{item["id"]}.png')
+                    logger.info(f"Error screenshot saved for item {item['id']}")
+                except:
+                    pass
+            return False
+            
+    def create_session_driver(self, cookies: List[Dict]) -> webdriver.Chrome:
+        """Start an extra driver that reuses the logged-in session cookies"""
+        driver = self.create_driver()
+        # Cookies can only be added for the domain that is currently open
+        driver.get("https://www.vinted.lv")
+        self.add_session_cookies(driver, cookies)
+        return driver
+        
+    def add_session_cookies(self, driver: webdriver.Chrome, cookies: List[Dict]):
+        """Add cookies to a driver, skipping any the browser rejects"""
+        for cookie in cookies:
             try:
-                self.driver.save_screenshot(f'/tmp/price_update_error_{item["id"]}.png')
-                logger.info(f"Error screenshot saved for item {item['id']}")
-            except:
-                pass
+                driver.add_cookie(cookie)
+            except Exception as e:
+                logger.debug("Skipping cookie %s: %s", cookie.get('name'), e)
+        
+    def update_item_price_api(self, item: Dict, session: requests.Session) -> bool:
+        """Update price for a single item through Vinted's item API (False means use the browser)"""
+        try:
+            response = session.put(
+                f"https://www.vinted.lv/api/v2/items/{item['id']}",
+                json={'item': {'price': round(item['new_price'], 2), 'currency': 'EUR'}},
+                timeout=20,
+            )
+        except requests.RequestException as e:
+            logger.warning("API price update failed for %s: %s", item['title'], e)
             return False
+        
+        if not response.ok:
+            logger.warning("API price update for %s returned HTTP %s", item['title'], response.status_code)
+            return False
+        
+        logger.info("✓ Price updated via API: %s €%.2f → €%.2f", item['title'], item['price'], item['new_price'])
+        self.record_price_update(item)
+        return True
+        
+    def update_prices(self, items_to_update: List[Dict]) -> int:
+        """Update prices on Vinted - through the item API when enabled, otherwise (or on failure) in the browser"""
+        updated = 0
+        if self.api_price_updates and items_to_update:
+            session = self.create_api_session(self.driver)
+            # Vinted's web app sends the page's CSRF token with every write request
+            csrf_token = self.driver.execute_script(
+                "const meta = document.querySelector(\"meta[name='csrf-token']\"); return meta ? meta.content : null;"
+            )
+            if not csrf_token:
+                # Not on a page that carries the meta tag - the API echoes the token in a response header
+                try:
+                    response = session.get("https://www.vinted.lv/api/v2/users/current", timeout=20)
+                    csrf_token = response.headers.get('x-csrf-token')
+                except requests.RequestException as e:
+                    logger.warning(f"Could not fetch CSRF token: {e}")
+            if csrf_token:
+                session.headers['X-CSRF-Token'] = csrf_token
+            
+            remaining = []
+            for item in items_to_update:
+                if self.update_item_price_api(item, session):
+                    updated += 1
+                else:
+                    remaining.append(item)
+            if remaining:
+                logger.info(f"Falling back to the browser for {len(remaining)} items")
+            items_to_update = remaining
+        
+        if items_to_update:
+            updated += self.update_prices_in_browser(items_to_update)
+        return updated
+        
+    def update_prices_in_browser(self, items_to_update: List[Dict]) -> int:
+        """Update prices through the edit form, spreading items over parallel browser sessions"""
+        workers = max(1, min(self.update_workers, len(items_to_update)))
+        
+        # Every worker thread owns exactly one driver - WebDriver sessions are not shared
+        cookies = self.driver.get_cookies()
+        drivers = [self.driver]
+        try:
+            # Chrome startup takes seconds - launch the extra sessions side by side
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers - 1) as executor:
+                    futures = [executor.submit(self.create_session_driver, cookies) for _ in range(workers - 1)]
+                for future in futures:
+                    try:
+                        drivers.append(future.result())
+                    except Exception as e:
+                        logger.warning(f"Could not start extra browser session: {e}")
             
+            logger.info(f"Updating {len(items_to_update)} items using {len(drivers)} browser sessions...")
+            # Workers pull from a shared queue, so a slow item doesn't hold up a fixed shard
+            pending = Queue()
+            for item in items_to_update:
+                pending.put(item)
+            
+            def update_worker(index):
+                updated = 0
+                while True:
+                    try:
+                        item = pending.get_nowait()
+                    except Empty:
+                        return updated
+                    if self.update_item_price(item, driver=drivers[index]):
+                        updated += 1
+                    elif not self.driver_alive(drivers[index]):
+                        # The browser session died - replace it and retry the item once
+                        logger.warning("Browser session lost - starting a new one")
+                        drivers[index].quit()
+                        try:
+                            drivers[index] = self.create_session_driver(cookies)
+                        except Exception as e:
+                            logger.error(f"Could not replace browser session: {e}")
+                            return updated  # Other workers keep draining the queue
+                        if index == 0:
+                            self.driver = drivers[0]  # run() closes the main driver
+                        if self.update_item_price(item, driver=drivers[index]):
+                            updated += 1
+            
+            with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+                return sum(executor.map(update_worker, range(len(drivers))))
+        finally:
+            # The main driver is closed by run()
+            for driver in drivers[1:]:
+                driver.quit()
+        
+    def record_price_update(self, item: Dict):
+        """Queue the sheet write for an item whose price was changed on Vinted"""
+        row_number = self.sheet_rows.get(item['id'])
+        if row_number is None:
+            return
+        # The new price is now the current one (Current Price and New Price are adjacent columns)
+        first_cell = rowcol_to_a1(row_number, COLUMN_INDEX['Current Price'] + 1)
+        last_cell = rowcol_to_a1(row_number, COLUMN_INDEX['New Price'] + 1)
+        with self.sheet_writes_lock:  # Browser workers report from several threads
+            self.pending_sheet_writes.append({
+                'range': f"'{self.sheet.title}'!{first_cell}:{last_cell}",
+                'values': [[item['new_price'], item['new_price']]],
+            })
+        
+    def flush_sheet_writes(self):
+        """Write all queued price cells to the sheet in one values.batchUpdate call"""
+        with self.sheet_writes_lock:
+            writes, self.pending_sheet_writes = self.pending_sheet_writes, []
+        if not writes:
+            return
+        try:
+            _sheets_call(self.sheet.spreadsheet.values_batch_update, body={
+                'valueInputOption': 'RAW',  # Same as the sync's typed writes - no locale re-parsing
+                'data': writes,
+            })
+            logger.info(f"✓ Wrote {len(writes)} updated prices back to the sheet")
+        except Exception as e:
+            logger.error(f"Could not write updated prices to the sheet: {e}")
+        
+    def driver_alive(self, driver: webdriver.Chrome) -> bool:
+        """Check whether a driver's browser session still responds"""
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+        
     def run(self):
         """Main execution flow"""
         try:
@@ -1042,8 +1652,8 @@ class VintedPriceBot:
                 logger.warning("No items found!")
                 return
             
-            # Sync with Google Sheets
-            items, existing_dict = self.sync_with_google_sheets(items)
+            # Sync with Google Sheets (only items whose price changes come back)
+            items_to_update = self.sync_with_google_sheets(items)
             
             # Now login for price updates
             logger.info("\n" + "=" * 60)
@@ -1062,13 +1672,6 @@ class VintedPriceBot:
                 logger.info("⚠️  TESTING MODE: Only updating last item with price change")
                 success_count = 0
                 
-                # Find items that need price changes (exclude new discoveries and items with no change)
-                items_to_update = [
-                    item for item in items 
-                    if item['new_price'] != item['price'] 
-                    and not item.get('is_new_discovery', False)  # Skip newly discovered items
-                ]
-                
                 if not items_to_update:
                     logger.info("No items need price updates")
                 else:
@@ -1081,8 +1684,7 @@ class VintedPriceBot:
                     percent_value = float(last_item.get('price_change_percent', 0))
                     logger.info(f"   Change: {percent_value:.1f}%")
                     
-                    if self.update_item_price(last_item, existing_dict):
-                        success_count += 1
+                    success_count += self.update_prices([last_item])
                 
                 logger.info("=" * 60)
                 logger.info(f"Bot completed! Updated {success_count}/{len(items_to_update) if items_to_update else 0} items (test mode)")
@@ -1098,6 +1700,8 @@ class VintedPriceBot:
             import traceback
             logger.error(traceback.format_exc())
         finally:
+            if self.sheet:
+                self.flush_sheet_writes()
             if self.driver:
                 self.driver.quit()
                 logger.info("WebDriver closed")